@@ -1,12 +1,69 @@
 import sys
 import argparse
+
+import numpy as np
 import pygame
 
 from minesweeper import config as cfg
 from minesweeper.utils import log_exception_to_file, show_error_screen, log_event
 from minesweeper.menu import run_menu, get_quit_confirm_rects, draw_quit_confirm
-from minesweeper.logic import create_mine_grid, calc_adjacency, reveal_cell, chord_reveal
-from minesweeper.render import draw_board, pixel_to_cell
+from minesweeper.logic import (
+    FLAG,
+    MINE,
+    REV,
+    create_mine_grid,
+    create_state,
+    count_remaining_safe,
+    calc_adjacency,
+    reveal_cell,
+    chord_reveal,
+)
+from minesweeper.fonts import get_font
+from minesweeper.render import (
+    build_tile_cache,
+    create_display,
+    draw_board,
+    pixel_to_cell,
+    rebuild_grid_bg,
+    rebuild_px_tables,
+    render_dirty,
+)
+
+
+def _on_hit_mine(state, dirty_cells: set[tuple[int, int]]) -> None:
+    # Uncover every mine once the game is lost
+    mines = (state & MINE) != 0
+    state[mines] |= REV
+    dirty_cells.update(map(tuple, np.argwhere(mines).tolist()))
+
+
+def _handle_result(
+    hit_mine: bool,
+    start_ticks: int | None,
+    end_ticks: int | None,
+    remaining_safe: int,
+    state,
+    dirty_cells: set[tuple[int, int]],
+    now_ticks: int,
+) -> tuple[str, int | None, int | None, int]:
+    """
+    Apply the outcome of a reveal or chord on a running game.
+    Returns (game_state, start_ticks, end_ticks, remaining_safe).
+    """
+    # Recount instead of having the reveal paths tally what they opened
+    new_remaining_safe = count_remaining_safe(state)
+    if start_ticks is None and (hit_mine or new_remaining_safe != remaining_safe):
+        start_ticks = now_ticks
+    remaining_safe = new_remaining_safe
+    game_state = "running"
+    if hit_mine:
+        game_state = "lost"
+        _on_hit_mine(state, dirty_cells)
+    elif remaining_safe == 0:
+        game_state = "won"
+    if game_state != "running" and start_ticks is not None and end_ticks is None:
+        end_ticks = now_ticks
+    return game_state, start_ticks, end_ticks, remaining_safe
 
 
 def main() -> None:
@@ -16,6 +73,7 @@ def main() -> None:
     parser.add_argument("--mines", type=int, default=cfg.NUM_MINES, help="Number of mines (default: 7)")
     parser.add_argument("--tile-size", type=int, default=cfg.TILE_SIZE, help="Tile size in pixels (default: 48)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging to run.log")
+    parser.add_argument("--vsync", action="store_true", help="Sync screen updates to the display refresh")
     args = parser.parse_args()
 
     # Apply CLI options into shared config
@@ -24,9 +82,7 @@ def main() -> None:
     cfg.TILE_SIZE = max(12, args.tile_size)
     cfg.NUM_MINES = max(1, min(args.mines, cfg.ROWS * cfg.COLUMNS - 1))
     cfg.DEBUG = bool(args.debug)
-
-    # Compute dimensions
-    cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT = cfg.compute_window_dimensions()
+    cfg.VSYNC = bool(args.vsync)
 
     pygame.init()
 
@@ -37,60 +93,127 @@ def main() -> None:
             pygame.quit()
             sys.exit(0)
         cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, cfg.TILE_SIZE = menu_result
-        cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT = cfg.compute_window_dimensions()
 
-    pygame.display.set_caption(f"Minesweeper ({cfg.COLUMNS}x{cfg.ROWS}, {cfg.NUM_MINES} mines)")
-    screen = pygame.display.set_mode((cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 24)
+    # Keep SDL from queueing event types the game never handles (mouse motion,
+    # text input, ...). The menu and error screen only need a subset of these.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.WINDOWEXPOSED,
+        ]
+    )
+    font = get_font(24)
 
     def reset():
         mine_grid_local = create_mine_grid(cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES)
         adjacency_local = calc_adjacency(mine_grid_local)
-        revealed_local = [[False for _ in range(cfg.COLUMNS)] for _ in range(cfg.ROWS)]
-        flagged_local = [[False for _ in range(cfg.COLUMNS)] for _ in range(cfg.ROWS)]
+        state_local = create_state(mine_grid_local)
         game_state_local = "running"
         remaining_safe_local = cfg.ROWS * cfg.COLUMNS - cfg.NUM_MINES
+        flags_placed_local = 0
         is_first_click_local = True
         start_ticks_local: int | None = None
         end_ticks_local: int | None = None
         return (
-            mine_grid_local,
+            state_local,
             adjacency_local,
-            revealed_local,
-            flagged_local,
             game_state_local,
             remaining_safe_local,
+            flags_placed_local,
             is_first_click_local,
             start_ticks_local,
             end_ticks_local,
         )
 
-    (
-        mine_grid,
+    def apply_settings(rows: int, cols: int, mines: int, tile: int):
+        """
+        Switch to a new board size, recreate the window and everything derived
+        from the layout, and start a fresh game. Returns (screen, reset()).
+        """
+        cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, cfg.TILE_SIZE = rows, cols, mines, tile
+        cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT = cfg.compute_window_dimensions()
+        pygame.display.set_caption(f"Minesweeper ({cfg.COLUMNS}x{cfg.ROWS}, {cfg.NUM_MINES} mines)")
+        screen_local = create_display((cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT))
+        build_tile_cache(font)
+        rebuild_px_tables()
+        rebuild_grid_bg()
+        return screen_local, reset()
+
+    screen, (
+        state,
         adjacency_grid,
-        revealed,
-        flagged,
         game_state,
         remaining_safe,
+        flags_placed,
         is_first_click,
         start_ticks,
         end_ticks,
-    ) = reset()
+    ) = apply_settings(cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, cfg.TILE_SIZE)
+
+    # Only cells listed in dirty_cells (and the status/footer bars when
+    # dirty_status is set) are repainted, unless a full redraw is pending.
+    full_redraw = True
+    dirty_cells: set[tuple[int, int]] = set()
+    dirty_status = False
+    last_elapsed_seconds = -1
+    elapsed_seconds = 0
+    # Held mouse buttons as a bitmask (bit 0 = left, bit 2 = right), tracked
+    # from events so chording does not have to poll SDL
+    mouse_buttons = 0
 
     while True:
-        clock.tick(cfg.FPS)
-        for event in pygame.event.get():
+        # Sleep until input arrives or the visible timer second is due to change
+        if game_state == "running" and start_ticks is not None:
+            next_deadline_ms = start_ticks + (elapsed_seconds + 1) * 1000
+            timeout_ms = max(1, next_deadline_ms - pygame.time.get_ticks())
+        else:
+            timeout_ms = 1000
+        first_event = pygame.event.wait(timeout_ms)
+        events = pygame.event.get()
+        if first_event.type != pygame.NOEVENT:
+            events.insert(0, first_event)
+        # One clock read per pass, shared by every event handled in it
+        now_ticks = pygame.time.get_ticks()
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_buttons |= 1 << (event.button - 1)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                mouse_buttons &= ~(1 << (event.button - 1))
+            if event.type == pygame.WINDOWEXPOSED:
+                # Only changed areas are normally pushed, so repaint everything
+                full_redraw = True
             if event.type == pygame.QUIT:
                 log_event("QUIT event received")
-                # Ask for confirmation
+                # Ask for confirmation. The dialog is static, so draw it once and
+                # block until input arrives; repaint only if the window is exposed.
                 confirming = True
+                repaint = True
                 while confirming:
-                    for ev in pygame.event.get():
+                    if repaint:
+                        draw_board(
+                            screen,
+                            font,
+                            state,
+                            adjacency_grid,
+                            game_state,
+                            remaining_safe,
+                            flags_placed,
+                            elapsed_seconds,
+                        )
+                        draw_quit_confirm(screen, font)
+                        pygame.display.flip()
+                        repaint = False
+                    for ev in [pygame.event.wait()] + pygame.event.get():
                         if ev.type == pygame.QUIT:
                             confirming = False
                             pygame.quit()
                             return
+                        if ev.type == pygame.WINDOWEXPOSED:
+                            repaint = True
                         if ev.type == pygame.KEYDOWN:
                             if ev.key in (pygame.K_ESCAPE, pygame.K_n):
                                 confirming = False
@@ -105,33 +228,22 @@ def main() -> None:
                                 return
                             if no_rect.collidepoint(mx, my):
                                 confirming = False
-                    draw_board(
-                        screen,
-                        font,
-                        mine_grid,
-                        adjacency_grid,
-                        revealed,
-                        flagged,
-                        game_state,
-                        remaining_safe,
-                        0,
-                    )
-                    draw_quit_confirm(screen, font)
-                    pygame.display.flip()
-                    clock.tick(30)
+                full_redraw = True
+                mouse_buttons = 0
+                now_ticks = pygame.time.get_ticks()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
                 log_event("Key R pressed: reset")
                 (
-                    mine_grid,
+                    state,
                     adjacency_grid,
-                    revealed,
-                    flagged,
                     game_state,
                     remaining_safe,
+                    flags_placed,
                     is_first_click,
                     start_ticks,
                     end_ticks,
                 ) = reset()
+                full_redraw = True
             if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
                 log_event("Key M pressed: open menu")
                 menu_result = run_menu(cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, cfg.TILE_SIZE)
@@ -139,126 +251,109 @@ def main() -> None:
                     log_event("Menu returned None (Quit)")
                     pygame.quit()
                     return
-                cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, cfg.TILE_SIZE = menu_result
-                cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT = cfg.compute_window_dimensions()
-                screen = pygame.display.set_mode((cfg.WINDOW_WIDTH, cfg.WINDOW_HEIGHT))
-                pygame.display.set_caption(
-                    f"Minesweeper ({cfg.COLUMNS}x{cfg.ROWS}, {cfg.NUM_MINES} mines)"
-                )
-                (
-                    mine_grid,
+                screen, (
+                    state,
                     adjacency_grid,
-                    revealed,
-                    flagged,
                     game_state,
                     remaining_safe,
+                    flags_placed,
                     is_first_click,
                     start_ticks,
                     end_ticks,
-                ) = reset()
+                ) = apply_settings(*menu_result)
+                full_redraw = True
+                mouse_buttons = 0
             if game_state == "running" and event.type == pygame.MOUSEBUTTONDOWN:
                 cell = pixel_to_cell(*event.pos)
                 if cell is None:
                     continue
                 r, c = cell
-                log_event(f"Mouse button {event.button} on cell ({r},{c})")
+                log_event("Mouse button %d on cell (%d,%d)", event.button, r, c)
+                dirty_status = True
                 if event.button == 2:
-                    hit_mine, opened = chord_reveal(
-                        r, c, mine_grid, adjacency_grid, revealed, flagged
+                    hit_mine = chord_reveal(r, c, state, adjacency_grid, dirty_cells)
+                    game_state, start_ticks, end_ticks, remaining_safe = _handle_result(
+                        hit_mine,
+                        start_ticks,
+                        end_ticks,
+                        remaining_safe,
+                        state,
+                        dirty_cells,
+                        now_ticks,
                     )
-                    if opened > 0 and start_ticks is None:
-                        start_ticks = pygame.time.get_ticks()
-                    if hit_mine:
-                        game_state = "lost"
-                        if start_ticks is not None and end_ticks is None:
-                            end_ticks = pygame.time.get_ticks()
-                        for rr in range(cfg.ROWS):
-                            for cc in range(cfg.COLUMNS):
-                                if mine_grid[rr][cc]:
-                                    revealed[rr][cc] = True
-                    else:
-                        remaining_safe -= opened
-                        if remaining_safe == 0:
-                            game_state = "won"
-                            if start_ticks is not None and end_ticks is None:
-                                end_ticks = pygame.time.get_ticks()
                 elif event.button == 1:
-                    pressed = pygame.mouse.get_pressed(3)
-                    if pressed[2] and revealed[r][c] and adjacency_grid[r][c] > 0:
-                        hit_mine, opened = chord_reveal(
-                            r, c, mine_grid, adjacency_grid, revealed, flagged
-                        )
-                        if opened > 0 and start_ticks is None:
-                            start_ticks = pygame.time.get_ticks()
-                        if hit_mine:
-                            game_state = "lost"
-                            if start_ticks is not None and end_ticks is None:
-                                end_ticks = pygame.time.get_ticks()
-                            for rr in range(cfg.ROWS):
-                                for cc in range(cfg.COLUMNS):
-                                    if mine_grid[rr][cc]:
-                                        revealed[rr][cc] = True
-                        else:
-                            remaining_safe -= opened
-                            if remaining_safe == 0:
-                                game_state = "won"
-                                if start_ticks is not None and end_ticks is None:
-                                    end_ticks = pygame.time.get_ticks()
-                        continue
-                    if is_first_click and not revealed[r][c]:
-                        is_first_click = False
-                        mine_grid = create_mine_grid(
-                            cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, exclude={(r, c)}
-                        )
-                        adjacency_grid = calc_adjacency(mine_grid)
-                        if start_ticks is None:
-                            start_ticks = pygame.time.get_ticks()
-                    elif start_ticks is None and not revealed[r][c]:
-                        start_ticks = pygame.time.get_ticks()
+                    if mouse_buttons & 0b100 and state[r, c] & REV and adjacency_grid[r, c] > 0:
+                        hit_mine = chord_reveal(r, c, state, adjacency_grid, dirty_cells)
+                    else:
+                        if is_first_click and not state[r, c] & REV:
+                            is_first_click = False
+                            mine_grid = create_mine_grid(
+                                cfg.ROWS, cfg.COLUMNS, cfg.NUM_MINES, exclude={(r, c)}
+                            )
+                            adjacency_grid = calc_adjacency(mine_grid)
+                            # Keep any flags placed before the first reveal
+                            state = create_state(mine_grid) | (state & FLAG)
+                            if start_ticks is None:
+                                start_ticks = now_ticks
+                        elif start_ticks is None and not state[r, c] & REV:
+                            start_ticks = now_ticks
 
-                    hit_mine, opened = reveal_cell(
-                        r, c, mine_grid, adjacency_grid, revealed, flagged
+                        hit_mine = reveal_cell(r, c, state, adjacency_grid, dirty_cells)
+                    game_state, start_ticks, end_ticks, remaining_safe = _handle_result(
+                        hit_mine,
+                        start_ticks,
+                        end_ticks,
+                        remaining_safe,
+                        state,
+                        dirty_cells,
+                        now_ticks,
                     )
-                    if hit_mine:
-                        game_state = "lost"
-                        if start_ticks is not None and end_ticks is None:
-                            end_ticks = pygame.time.get_ticks()
-                        for rr in range(cfg.ROWS):
-                            for cc in range(cfg.COLUMNS):
-                                if mine_grid[rr][cc]:
-                                    revealed[rr][cc] = True
-                    else:
-                        remaining_safe -= opened
-                        if remaining_safe == 0:
-                            game_state = "won"
-                            if start_ticks is not None and end_ticks is None:
-                                end_ticks = pygame.time.get_ticks()
                 elif event.button == 3:
-                    if not revealed[r][c]:
-                        flagged[r][c] = not flagged[r][c]
+                    if not state[r, c] & REV:
+                        state[r, c] ^= FLAG
+                        flags_placed += 1 if state[r, c] & FLAG else -1
+                        dirty_cells.add((r, c))
 
         # Compute elapsed time in seconds; freeze when game is over
         if start_ticks is None:
             elapsed_seconds = 0
+        elif game_state == "running" or end_ticks is None:
+            elapsed_seconds = max(0, (now_ticks - start_ticks) // 1000)
         else:
-            now_ticks = pygame.time.get_ticks()
-            if game_state == "running" or end_ticks is None:
-                elapsed_seconds = max(0, (now_ticks - start_ticks) // 1000)
-            else:
-                elapsed_seconds = max(0, (end_ticks - start_ticks) // 1000)
+            elapsed_seconds = max(0, (end_ticks - start_ticks) // 1000)
 
-        draw_board(
-            screen,
-            font,
-            mine_grid,
-            adjacency_grid,
-            revealed,
-            flagged,
-            game_state,
-            remaining_safe,
-            elapsed_seconds,
-        )
-        pygame.display.flip()
+        if elapsed_seconds != last_elapsed_seconds:
+            last_elapsed_seconds = elapsed_seconds
+            dirty_status = True
+
+        if full_redraw:
+            draw_board(
+                screen,
+                font,
+                state,
+                adjacency_grid,
+                game_state,
+                remaining_safe,
+                flags_placed,
+                elapsed_seconds,
+            )
+            pygame.display.flip()
+        elif dirty_cells or dirty_status:
+            render_dirty(
+                screen,
+                font,
+                state,
+                adjacency_grid,
+                game_state,
+                remaining_safe,
+                flags_placed,
+                elapsed_seconds,
+                dirty_cells,
+                dirty_status,
+            )
+        full_redraw = False
+        dirty_cells.clear()
+        dirty_status = False
 
 
 if __name__ == "__main__":
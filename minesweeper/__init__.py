@@ -1,7 +1,8 @@
-from . import config, utils, logic, render, menu
+from . import config, fonts, utils, logic, render, menu
 
 __all__ = [
     "config",
+    "fonts",
     "utils",
     "logic",
     "render",
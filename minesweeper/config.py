@@ -14,8 +14,10 @@ H_PADDING: int = 16
 V_PADDING: int = 16
 STATUS_BAR_HEIGHT: int = 28
 FOOTER_BAR_HEIGHT: int = 28
-FPS: int = 60
 DEBUG: bool = False
+# Sync presents to the display refresh; off by default since the board only
+# repaints on input or timer ticks and a blocking present adds input latency
+VSYNC: bool = False
 STATUS_FONT_BASE: int = 28
 
 # Grid constraints
@@ -24,6 +26,11 @@ MAX_ROWS: int = 16
 MIN_COLS: int = 6
 MAX_COLS: int = 20
 
+# Boards with more cells than this reveal through the Numba kernel, if installed.
+# Only takes effect if MAX_ROWS/MAX_COLS are raised: the largest board allowed
+# today is 16 * 20 = 320 cells, where the pure-Python fill is fast enough.
+NUMBA_MIN_CELLS: int = 2000
+
 # Window dimensions computed at runtime from current settings
 WINDOW_WIDTH: int | None = None
 WINDOW_HEIGHT: int | None = None
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+# Shared font registry for the game, menu and error screen. Depends only on
+# pygame so the crash fallback in utils.py can use it without importing the
+# renderer.
+
+import pygame
+
+# Default fonts by point size, so each SysFont lookup happens once per session
+_font_cache: dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return the default system font at `size` points, loading it on first use."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.SysFont(None, size)
+    return font
+
+
+def clear_font_cache() -> None:
+    """Forget cached fonts; required after pygame.font has been quit and re-initialised."""
+    _font_cache.clear()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+# Numba-compiled kernels for large boards. Numba is an optional dependency:
+# importing this module raises ImportError when it is missing, and the
+# callers in logic.py fall back to the pure-Python implementations.
+
+import numpy as np
+from numba import njit
+
+from .logic import FLAG, MINE, REV
+
+
+@njit(cache=True)
+def flood_fill(r, c, state, adjacency_grid, opened_cells):
+    """
+    Native counterpart of logic.reveal_cell. Writes the flat index of every
+    newly revealed cell into opened_cells and returns (hit_mine, num_opened).
+    """
+    rows, columns = state.shape
+    if state[r, c] & (REV | FLAG):
+        return False, 0
+
+    state[r, c] |= REV
+    opened_cells[0] = r * columns + c
+    opened = 1
+    if state[r, c] & MINE:
+        return True, opened
+    if adjacency_grid[r, c] != 0:
+        return False, opened
+
+    # Cells are marked revealed when pushed, so each one enters the stack once
+    stack = np.empty(rows * columns, np.int32)
+    stack[0] = r * columns + c
+    top = 1
+    while top > 0:
+        top -= 1
+        cr = stack[top] // columns
+        cc = stack[top] % columns
+        for dr in range(-1, 2):
+            for dc in range(-1, 2):
+                nr = cr + dr
+                nc = cc + dc
+                if nr < 0 or nr >= rows or nc < 0 or nc >= columns:
+                    continue
+                if state[nr, nc] & (REV | FLAG):
+                    continue
+                # Neighbours of a blank cell are never mines
+                state[nr, nc] |= REV
+                opened_cells[opened] = nr * columns + nc
+                opened += 1
+                if adjacency_grid[nr, nc] == 0:
+                    stack[top] = nr * columns + nc
+                    top += 1
+    return False, opened
@@ -1,15 +1,58 @@
 from __future__ import annotations
 
-import random
-from typing import List, Tuple
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
 
 from . import config as cfg
 
 # Board state containers
-MineGrid = List[List[bool]]
-AdjacencyGrid = List[List[int]]
-RevealedGrid = List[List[bool]]
-FlagGrid = List[List[bool]]
+MineGrid = npt.NDArray[np.bool_]
+AdjacencyGrid = npt.NDArray[np.int8]
+StateGrid = npt.NDArray[np.uint8]
+
+# Per-cell bits of a StateGrid
+REV = 1
+FLAG = 2
+MINE = 4
+
+# (dr, dc) offsets of the 8 cells surrounding a cell
+_NEIGHBORS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+@lru_cache(maxsize=4)
+def _neighbor_table(rows: int, columns: int) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """In-bounds 8-neighbours of every cell, indexed by r * columns + c."""
+    return tuple(
+        tuple(
+            (r + dr, c + dc)
+            for dr, dc in _NEIGHBORS8
+            if 0 <= r + dr < rows and 0 <= c + dc < columns
+        )
+        for r in range(rows)
+        for c in range(columns)
+    )
+
+
+# Shared generator for mine placement, seeded once from OS entropy
+_rng = np.random.default_rng()
+
+# Numba flood-fill kernel, resolved on first use; False once known to be unavailable
+_flood_fill_nb = None
+
+
+def _get_flood_fill_nb():
+    global _flood_fill_nb
+    if _flood_fill_nb is None:
+        try:
+            from .jit import flood_fill
+        except ImportError:
+            _flood_fill_nb = False
+        else:
+            _flood_fill_nb = flood_fill
+    return _flood_fill_nb or None
 
 
 def create_mine_grid(
@@ -18,127 +61,174 @@ def create_mine_grid(
     num_mines: int,
     exclude: set[tuple[int, int]] | None = None,
 ) -> MineGrid:
-    all_positions = [(r, c) for r in range(rows) for c in range(columns)]
-    available = [pos for pos in all_positions if not exclude or pos not in exclude]
-    if num_mines > len(available):
+    # Sample mine positions as flat cell indices, skipping excluded cells
+    available = np.ones(rows * columns, dtype=np.bool_)
+    for er, ec in exclude or ():
+        available[er * columns + ec] = False
+    candidates = np.flatnonzero(available)
+    if num_mines > len(candidates):
         raise ValueError(
             "Number of mines exceeds available cells when applying exclusions"
         )
-    mine_positions = set(random.sample(available, num_mines))
-    return [[(r, c) in mine_positions for c in range(columns)] for r in range(rows)]
+    mine_grid = np.zeros(rows * columns, dtype=np.bool_)
+    mine_grid[_rng.choice(candidates, size=num_mines, replace=False)] = True
+    return mine_grid.reshape(rows, columns)
 
 
 def calc_adjacency(mine_grid: MineGrid) -> AdjacencyGrid:
-    rows = len(mine_grid)
-    columns = len(mine_grid[0])
-
-    def neighbors(r: int, c: int):
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < columns:
-                    yield nr, nc
-
-    adjacency: AdjacencyGrid = [[0 for _ in range(columns)] for _ in range(rows)]
-    for r in range(rows):
-        for c in range(columns):
-            if mine_grid[r][c]:
-                adjacency[r][c] = -1  # sentinel for mine
-            else:
-                count = 0
-                for nr, nc in neighbors(r, c):
-                    if mine_grid[nr][nc]:
-                        count += 1
-                adjacency[r][c] = count
+    rows, columns = mine_grid.shape
+    m = mine_grid.astype(np.uint8)
+
+    # Sum the 8 shifted views of the mine plane; each slice pair lines a cell
+    # up with its neighbour at offset (dr, dc), clipped at the board edges.
+    adjacency = np.zeros_like(m, dtype=np.int8)
+    for dr, dc in _NEIGHBORS8:
+        adjacency[
+            max(0, dr) : rows + min(0, dr), max(0, dc) : columns + min(0, dc)
+        ] += m[-min(0, dr) : rows - max(0, dr), -min(0, dc) : columns - max(0, dc)]
+    adjacency[mine_grid] = -1  # sentinel for mine
     return adjacency
 
 
+def create_state(mine_grid: MineGrid) -> StateGrid:
+    """Packs the mine layout into a fresh state grid with nothing revealed or flagged."""
+    state = np.zeros(mine_grid.shape, dtype=np.uint8)
+    state[mine_grid] = MINE
+    return state
+
+
 def reveal_cell(
     r: int,
     c: int,
-    mine_grid: MineGrid,
+    state: StateGrid,
     adjacency_grid: AdjacencyGrid,
-    revealed: RevealedGrid,
-    flagged: FlagGrid,
-) -> Tuple[bool, int]:
+    dirty: set[tuple[int, int]] | None = None,
+) -> bool:
     """
-    Reveals the cell at (r, c). Returns (hit_mine, num_newly_revealed).
+    Reveals the cell at (r, c) and returns whether it was a mine.
+    Every newly revealed cell is added to `dirty` when it is given.
+
+    Blank regions are opened with a scan-line fill: each horizontal run of
+    blank cells is revealed in one sweep, and only the rows directly above and
+    below a run are scanned for further runs. Boards larger than
+    cfg.NUMBA_MIN_CELLS use the Numba kernel from jit.py instead, when Numba
+    is installed; the default MAX_ROWS/MAX_COLS limits keep every board
+    below that size.
     """
-    if revealed[r][c] or flagged[r][c]:
-        return False, 0
-
-    newly_revealed = 0
-    stack = [(r, c)]
-    while stack:
-        cr, cc = stack.pop()
-        if revealed[cr][cc] or flagged[cr][cc]:
-            continue
-
-        revealed[cr][cc] = True
-        newly_revealed += 1
-
-        if mine_grid[cr][cc]:
-            # If we popped into a mine due to direct click, signal mine. We still mark it revealed.
-            return True, newly_revealed
-
-        if adjacency_grid[cr][cc] == 0:
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    nr, nc = cr + dr, cc + dc
-                    if 0 <= nr < cfg.ROWS and 0 <= nc < cfg.COLUMNS and not revealed[nr][nc]:
-                        if not mine_grid[nr][nc]:
-                            stack.append((nr, nc))
-                        else:
-                            # Do not auto-open mines
-                            continue
-
-    return False, newly_revealed
+    s = state[r, c]
+    if s & (REV | FLAG):
+        return False
+
+    if state.size > cfg.NUMBA_MIN_CELLS:
+        flood_fill_nb = _get_flood_fill_nb()
+        if flood_fill_nb is not None:
+            opened_cells = np.empty(state.size, dtype=np.int32)
+            hit_mine, opened = flood_fill_nb(r, c, state, adjacency_grid, opened_cells)
+            if dirty is not None:
+                columns = state.shape[1]
+                dirty.update(divmod(v, columns) for v in opened_cells[:opened].tolist())
+            return bool(hit_mine)
+
+    if s & MINE or adjacency_grid[r, c] != 0:
+        state[r, c] = s | REV
+        if dirty is not None:
+            dirty.add((r, c))
+        # If this is a mine due to direct click, signal it. We still mark it revealed.
+        return bool(s & MINE)
+
+    rows, columns = state.shape
+    # Scan over flat Python copies, addressing cells as y * columns + x:
+    # visited is 1 for revealed or flagged cells, and opened cells are
+    # written back to `state` in one go at the end
+    visited = bytearray(((state & (REV | FLAG)) != 0).tobytes())
+    adjacency = adjacency_grid.ravel().tolist()
+    opened: list[int] = []
+    spans: deque[tuple[int, int, int]] = deque()
+
+    def line_fill(x: int, y: int) -> int:
+        # Grow the blank run through (y, x) to both sides, reveal it together
+        # with the numbered cells that bound it, and queue it for scanning.
+        base = y * columns
+        lx = x
+        while lx > 0 and not visited[base + lx - 1] and adjacency[base + lx - 1] == 0:
+            lx -= 1
+        rx = x
+        while rx < columns - 1 and not visited[base + rx + 1] and adjacency[base + rx + 1] == 0:
+            rx += 1
+        for i in range(base + max(0, lx - 1), base + min(columns - 1, rx + 1) + 1):
+            if not visited[i]:
+                visited[i] = 1
+                opened.append(i)
+        spans.append((lx, rx, y))
+        return rx
+
+    line_fill(c, r)
+    while spans:
+        lx, rx, y = spans.popleft()
+        for ny in (y - 1, y + 1):
+            if not 0 <= ny < rows:
+                continue
+            base = ny * columns
+            # Every cell in [lx - 1, rx + 1] touches the blank run, so none of them is a mine
+            x = max(0, lx - 1)
+            end = min(columns - 1, rx + 1)
+            while x <= end:
+                i = base + x
+                if not visited[i]:
+                    if adjacency[i] == 0:
+                        x = line_fill(x, ny)
+                    else:
+                        visited[i] = 1
+                        opened.append(i)
+                x += 1
+
+    opened_rows, opened_cols = np.divmod(np.array(opened, dtype=np.intp), columns)
+    state[opened_rows, opened_cols] |= REV
+    if dirty is not None:
+        dirty.update(zip(opened_rows.tolist(), opened_cols.tolist()))
+    return False
 
 
 def chord_reveal(
     r: int,
     c: int,
-    mine_grid: MineGrid,
+    state: StateGrid,
     adjacency_grid: AdjacencyGrid,
-    revealed: RevealedGrid,
-    flagged: FlagGrid,
-) -> Tuple[bool, int]:
+    dirty: set[tuple[int, int]] | None = None,
+) -> bool:
     """
     If the number of flagged neighbors equals the number on a revealed numbered tile,
-    reveal all unflagged, unrevealed neighbors. Returns (hit_mine, total_opened).
+    reveal all unflagged, unrevealed neighbors. Returns whether a mine was hit.
+    Opened cells are added to `dirty` when it is given.
     """
-    if not revealed[r][c]:
-        return False, 0
-    number_on_tile = adjacency_grid[r][c]
+    if not state[r, c] & REV:
+        return False
+    number_on_tile = adjacency_grid[r, c]
     if number_on_tile <= 0:
-        return False, 0
+        return False
 
-    # Count flags around
+    # One pass over the neighbours: count flags and remember the hidden cells
+    rows, columns = state.shape
     flagged_count = 0
-    neighbors_coords: list[tuple[int, int]] = []
-    for dr in (-1, 0, 1):
-        for dc in (-1, 0, 1):
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < cfg.ROWS and 0 <= nc < cfg.COLUMNS:
-                neighbors_coords.append((nr, nc))
-                if flagged[nr][nc]:
-                    flagged_count += 1
+    hidden: list[tuple[int, int]] = []
+    for nr, nc in _neighbor_table(rows, columns)[r * columns + c]:
+        s = state[nr, nc]
+        if s & FLAG:
+            flagged_count += 1
+        elif not s & REV:
+            hidden.append((nr, nc))
 
     if flagged_count != number_on_tile:
-        return False, 0
+        return False
+
+    # reveal_cell skips cells already opened by an earlier neighbour's flood fill
+    for nr, nc in hidden:
+        if reveal_cell(nr, nc, state, adjacency_grid, dirty):
+            return True
+
+    return False
 
-    total_opened = 0
-    for nr, nc in neighbors_coords:
-        if not flagged[nr][nc] and not revealed[nr][nc]:
-            hit_mine, opened = reveal_cell(nr, nc, mine_grid, adjacency_grid, revealed, flagged)
-            total_opened += opened
-            if hit_mine:
-                return True, total_opened
 
-    return False, total_opened
+def count_remaining_safe(state: StateGrid) -> int:
+    """Number of safe cells that are still unrevealed."""
+    return int(np.count_nonzero((state & (MINE | REV)) == 0))
@@ -3,9 +3,41 @@ from __future__ import annotations
 import pygame
 
 from . import config as cfg
+from .fonts import get_font
+
+# Quit dialog geometry and dim overlay, rebuilt only when the window size changes
+_quit_cache_wh: tuple[int, int] | None = None
+_quit_rects_cache: tuple[pygame.Rect, pygame.Rect, pygame.Rect] | None = None
+_quit_dim_surf: pygame.Surface | None = None
+# The dialog's text never changes, so each label is rendered once per font
+_quit_text_cache: dict[tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _quit_text(font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    surface = _quit_text_cache.get(key)
+    if surface is None:
+        surface = _quit_text_cache[key] = font.render(text, True, color)
+    return surface
+
+
+def _refresh_quit_cache() -> None:
+    global _quit_cache_wh, _quit_rects_cache, _quit_dim_surf
+    wh = ((cfg.WINDOW_WIDTH or 0), (cfg.WINDOW_HEIGHT or 0))
+    if wh == _quit_cache_wh:
+        return
+    _quit_rects_cache = _build_quit_confirm_rects()
+    _quit_dim_surf = pygame.Surface(wh, pygame.SRCALPHA)
+    _quit_dim_surf.fill((0, 0, 0, 140))
+    _quit_cache_wh = wh
 
 
 def get_quit_confirm_rects() -> tuple[pygame.Rect, pygame.Rect, pygame.Rect]:
+    _refresh_quit_cache()
+    return _quit_rects_cache
+
+
+def _build_quit_confirm_rects() -> tuple[pygame.Rect, pygame.Rect, pygame.Rect]:
     overlay_width = min(420, (cfg.WINDOW_WIDTH or 0) - 40)
     overlay_height = 150
     overlay_x = ((cfg.WINDOW_WIDTH or 0) - overlay_width) // 2
@@ -33,23 +65,21 @@ def get_quit_confirm_rects() -> tuple[pygame.Rect, pygame.Rect, pygame.Rect]:
 def draw_quit_confirm(screen: pygame.Surface, font: pygame.font.Font) -> None:
     yes_rect, no_rect, overlay_rect = get_quit_confirm_rects()
     # Dim background
-    dim = pygame.Surface(((cfg.WINDOW_WIDTH or 0), (cfg.WINDOW_HEIGHT or 0)), pygame.SRCALPHA)
-    dim.fill((0, 0, 0, 140))
-    screen.blit(dim, (0, 0))
+    screen.blit(_quit_dim_surf, (0, 0))
 
     # Panel
     pygame.draw.rect(screen, (50, 50, 50), overlay_rect, border_radius=8)
     pygame.draw.rect(screen, (90, 90, 90), overlay_rect, width=2, border_radius=8)
 
-    msg1 = font.render("Quit the game?", True, (230, 230, 230))
-    msg2 = font.render("Y = Yes, N/Esc = No", True, (180, 180, 180))
+    msg1 = _quit_text(font, "Quit the game?", (230, 230, 230))
+    msg2 = _quit_text(font, "Y = Yes, N/Esc = No", (180, 180, 180))
     screen.blit(msg1, (overlay_rect.centerx - msg1.get_width() // 2, overlay_rect.top + 24))
     screen.blit(msg2, (overlay_rect.centerx - msg2.get_width() // 2, overlay_rect.top + 56))
 
     # Buttons
     def draw_btn(rect: pygame.Rect, label: str):
         pygame.draw.rect(screen, (70, 70, 70), rect, border_radius=6)
-        t = font.render(label, True, (230, 230, 230))
+        t = _quit_text(font, label, (230, 230, 230))
         screen.blit(t, (rect.centerx - t.get_width() // 2, rect.centery - t.get_height() // 2))
 
     draw_btn(yes_rect, "Yes")
@@ -64,7 +94,7 @@ def run_menu(
     pygame.display.set_caption("Minesweeper - Setup")
     screen = pygame.display.set_mode((menu_width, menu_height))
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 28)
+    font = get_font(28)
 
     rows = max(cfg.MIN_ROWS, min(cfg.MAX_ROWS, initial_rows))
     cols = max(cfg.MIN_COLS, min(cfg.MAX_COLS, initial_cols))
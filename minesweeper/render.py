@@ -1,31 +1,105 @@
 from __future__ import annotations
 
+from array import array
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 
 from . import config as cfg
+from .fonts import get_font
+from .logic import FLAG, MINE, REV
 
+# Pre-rendered tiles keyed by (tile size, kind); kind is "hidden", "flag",
+# "revealed", "mine" or an adjacency number 1-8.
+TILE_CACHE: dict[tuple[int, str | int], pygame.Surface] = {}
 
-def pixel_to_cell(x: int, y: int) -> tuple[int, int] | None:
-    # Adjust for margins and status bar
+# Hidden tiles and grid lines for the whole board, see rebuild_grid_bg()
+GRID_BG: pygame.Surface | None = None
+
+# Grid row/column under each pixel (-1 outside the grid), see rebuild_px_tables()
+PX_TO_ROW = array("i")
+PX_TO_COL = array("i")
+# Screen rect of every tile as TILE_RECTS[r][c], rebuilt with the pixel tables
+TILE_RECTS: list[list[pygame.Rect]] = []
+# Window padding left and right of the grid; the only background that neither
+# the status/footer bars nor GRID_BG cover. Rebuilt with the pixel tables.
+BG_RECTS: list[pygame.Rect] = []
+
+# Last rendered footer as ((text, color), surface); re-rendered only when the key changes
+_footer_cache: tuple[tuple[str, tuple[int, int, int]], pygame.Surface] | None = None
+
+# Recently rendered status lines keyed by (text, window width), least recent first.
+# Flagging and unflagging flips between a few mine counts, so keep several.
+_STATUS_CACHE_SIZE = 5
+_status_cache: OrderedDict[tuple[str, int], pygame.Surface] = OrderedDict()
+
+# Smaller sizes tried in order when the status line is too wide at STATUS_FONT_BASE
+_STATUS_FONT_LADDER = (24, 22, 20, 18, 16)
+
+
+def create_display(size: tuple[int, int]) -> pygame.Surface:
+    """Open the game window at `size`, double-buffered and with vsync if cfg.VSYNC."""
+    try:
+        return pygame.display.set_mode(size, pygame.DOUBLEBUF, vsync=int(cfg.VSYNC))
+    except pygame.error:
+        # vsync not supported on this platform
+        return pygame.display.set_mode(size)
+
+
+def rebuild_px_tables() -> None:
+    """Rebuild the pixel -> row/column lookup tables, TILE_RECTS and BG_RECTS for the current layout."""
     grid_top = cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT
-    if y < grid_top:
-        return None
+    width = cfg.WINDOW_WIDTH or 0
+    height = cfg.WINDOW_HEIGHT or 0
 
-    grid_x = x - cfg.H_PADDING
-    grid_y = y - grid_top
+    def lookup(length: int, origin: int, count: int) -> array:
+        table = array("i", [-1]) * length
+        for px in range(max(0, origin), min(length, origin + count * cfg.TILE_SIZE)):
+            table[px] = (px - origin) // cfg.TILE_SIZE
+        return table
 
-    if grid_x < 0 or grid_y < 0:
-        return None
+    PX_TO_ROW[:] = lookup(height, grid_top, cfg.ROWS)
+    PX_TO_COL[:] = lookup(width, cfg.H_PADDING, cfg.COLUMNS)
+    TILE_RECTS[:] = [[tile_rect(r, c) for c in range(cfg.COLUMNS)] for r in range(cfg.ROWS)]
+    grid_right = cfg.H_PADDING + cfg.COLUMNS * cfg.TILE_SIZE
+    grid_height = cfg.ROWS * cfg.TILE_SIZE
+    BG_RECTS[:] = [
+        pygame.Rect(0, grid_top, cfg.H_PADDING, grid_height),
+        pygame.Rect(grid_right, grid_top, max(0, width - grid_right), grid_height),
+    ]
 
-    c = grid_x // cfg.TILE_SIZE
-    r = grid_y // cfg.TILE_SIZE
 
-    if 0 <= r < cfg.ROWS and 0 <= c < cfg.COLUMNS:
+def pixel_to_cell(x: int, y: int) -> tuple[int, int] | None:
+    if not (0 <= y < len(PX_TO_ROW) and 0 <= x < len(PX_TO_COL)):
+        return None
+    r = PX_TO_ROW[y]
+    c = PX_TO_COL[x]
+    if r >= 0 and c >= 0:
         return (r, c)
     return None
 
 
 def draw_bomb_icon(screen: pygame.Surface, rect: pygame.Rect) -> None:
+    """Draw the bomb centred in `rect`, shrunk only if it would not fit.
+
+    The fuse and spark reach up and right past a body centred in the tile, so
+    the icon is drawn on a scratch surface and its bounding box is fitted into
+    `rect`; drawn straight onto a tile surface the spark would be cut off.
+    """
+    scratch = pygame.Surface((rect.width * 3, rect.height * 3), pygame.SRCALPHA)
+    _draw_bomb_shape(scratch, pygame.Rect(rect.width, rect.height, rect.width, rect.height))
+    bounds = scratch.get_bounding_rect()
+    icon = scratch.subsurface(bounds)
+    scale = min(1.0, rect.width / bounds.width, rect.height / bounds.height)
+    if scale < 1.0:
+        icon = pygame.transform.smoothscale(
+            icon, (int(bounds.width * scale), int(bounds.height * scale))
+        )
+    screen.blit(icon, icon.get_rect(center=rect.center))
+
+
+def _draw_bomb_shape(screen: pygame.Surface, rect: pygame.Rect) -> None:
     radius = max(6, min(rect.width, rect.height) // 3)
     center_x, center_y = rect.center
     # Body
@@ -85,25 +159,100 @@ def draw_watermelon_icon(screen: pygame.Surface, rect: pygame.Rect) -> None:
         pygame.draw.circle(screen, (15, 15, 15), (sx, sy), max(1, radius // 8))
 
 
-def draw_board(
-    screen: pygame.Surface,
-    font: pygame.font.Font,
-    mine_grid,
-    adjacency_grid,
-    revealed,
-    flagged,
-    game_state: str,
-    remaining_safe: int,
-    elapsed_seconds: int,
-) -> None:
-    screen.fill(cfg.COLOR_BG)
+def build_tile_cache(font: pygame.font.Font) -> None:
+    """Render every tile variant for the current TILE_SIZE.
+
+    Must be called after the display mode is set, and again whenever the tile
+    size changes.
+    """
+    TILE_CACHE.clear()
+    size = cfg.TILE_SIZE - cfg.GRID_LINE
+    rect = pygame.Rect(0, 0, size, size)
+
+    def new_tile(color: tuple[int, int, int]) -> pygame.Surface:
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(color)
+        return surface
+
+    hidden = new_tile(cfg.COLOR_TILE_HIDDEN)
+    flag = new_tile(cfg.COLOR_TILE_HIDDEN)
+    draw_watermelon_icon(flag, rect)
+    mine = new_tile(cfg.COLOR_TILE_MINE)
+    draw_bomb_icon(mine, rect)
+    TILE_CACHE[(cfg.TILE_SIZE, "hidden")] = hidden
+    TILE_CACHE[(cfg.TILE_SIZE, "flag")] = flag
+    TILE_CACHE[(cfg.TILE_SIZE, "revealed")] = new_tile(cfg.COLOR_TILE_REVEALED)
+    TILE_CACHE[(cfg.TILE_SIZE, "mine")] = mine
+    for number in range(1, 9):
+        tile = new_tile(cfg.COLOR_TILE_REVEALED)
+        color = cfg.NUMBER_COLORS.get(number, cfg.COLOR_TEXT)
+        digit = font.render(str(number), True, color).convert_alpha()
+        tile.blit(digit, digit.get_rect(center=rect.center))
+        TILE_CACHE[(cfg.TILE_SIZE, number)] = tile
+
+
+def rebuild_grid_bg() -> None:
+    """Pre-compose the all-hidden board; call after build_tile_cache()."""
+    global GRID_BG
+    GRID_BG = pygame.Surface(
+        (cfg.COLUMNS * cfg.TILE_SIZE, cfg.ROWS * cfg.TILE_SIZE)
+    ).convert()
+    GRID_BG.fill(cfg.COLOR_BG)
+    size = cfg.TILE_SIZE
+    hidden = TILE_CACHE[(size, "hidden")]
+    for r in range(cfg.ROWS):
+        for c in range(cfg.COLUMNS):
+            GRID_BG.blit(hidden, (c * size, r * size))
+
+
+def tile_rect(r: int, c: int) -> pygame.Rect:
+    grid_top = cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT
+    return pygame.Rect(
+        cfg.H_PADDING + c * cfg.TILE_SIZE,
+        grid_top + r * cfg.TILE_SIZE,
+        cfg.TILE_SIZE - cfg.GRID_LINE,
+        cfg.TILE_SIZE - cfg.GRID_LINE,
+    )
+
+
+def tile_kind(r: int, c: int, state, adjacency_grid) -> str | int:
+    s = state[r, c]
+    if s & REV:
+        if s & MINE:
+            return "mine"
+        adj = int(adjacency_grid[r, c])
+        return adj if adj > 0 else "revealed"
+    return "flag" if s & FLAG else "hidden"
+
+
+def blit_tiles(screen: pygame.Surface, blit_seq: list[tuple[pygame.Surface, pygame.Rect]]) -> None:
+    """Blit a batch of (surface, dest) pairs in a single call, without collecting result rects."""
+    # pygame-ce's fblits is the leaner variant of blits(..., doreturn=False)
+    fblits = getattr(screen, "fblits", None)
+    if fblits is not None:
+        fblits(blit_seq)
+    else:
+        screen.blits(blit_seq, doreturn=False)
+
+
+def draw_grid_border(screen: pygame.Surface) -> None:
+    grid_top = cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT
+    grid_rect = pygame.Rect(
+        cfg.H_PADDING, grid_top, cfg.COLUMNS * cfg.TILE_SIZE, cfg.ROWS * cfg.TILE_SIZE
+    )
+    pygame.draw.rect(screen, cfg.COLOR_GRID, grid_rect, width=2)
+
+
+def draw_status(
+    screen: pygame.Surface, flags_placed: int, game_state: str
+) -> pygame.Rect:
+    """Draw the status bar above the grid and return the area it covers."""
+    width = cfg.WINDOW_WIDTH or screen.get_width()
+    status_rect = pygame.Rect(0, 0, width, cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT)
+    screen.fill(cfg.COLOR_BG, status_rect)
 
-    # Status text
     if game_state == "running":
         # Remaining mines: total mines minus placed flags
-        flags_placed = sum(
-            1 for r in range(cfg.ROWS) for c in range(cfg.COLUMNS) if flagged[r][c]
-        )
         remaining_mines = max(0, cfg.NUM_MINES - flags_placed)
         status_text = (
             f"Mines: {remaining_mines}    L: reveal   R: flag   Mid: chord   M: menu"
@@ -115,57 +264,42 @@ def draw_board(
     elif game_state == "won":
         status_text = "You won! Press R to restart, M for menu."
 
-    # Render status text with dynamic downscaling to fit narrow windows
-    available_width = max(
-        50, (cfg.WINDOW_WIDTH or screen.get_width()) - 2 * cfg.H_PADDING
-    )
-    status_font = pygame.font.SysFont(None, cfg.STATUS_FONT_BASE)
-    status_surface = status_font.render(status_text, True, cfg.COLOR_STATUS)
-    if status_surface.get_width() > available_width:
-        # Estimate a smaller size based on width ratio
-        base_size = max(12, status_font.get_height())
-        target_size = max(
-            16, int(base_size * available_width / max(1, status_surface.get_width()))
-        )
-        # Re-render with a smaller font
-        status_font = pygame.font.SysFont(None, target_size)
+    key = (status_text, width)
+    status_surface = _status_cache.get(key)
+    if status_surface is not None:
+        _status_cache.move_to_end(key)
+    else:
+        # Render status text with dynamic downscaling to fit narrow windows
+        available_width = max(50, width - 2 * cfg.H_PADDING)
+        # Measure down the ladder and render once with the first size that fits
+        for size in (cfg.STATUS_FONT_BASE, *_STATUS_FONT_LADDER):
+            status_font = get_font(size)
+            if status_font.size(status_text)[0] <= available_width:
+                break
         status_surface = status_font.render(status_text, True, cfg.COLOR_STATUS)
+        status_surface = status_surface.convert_alpha()
+        _status_cache[key] = status_surface
+        if len(_status_cache) > _STATUS_CACHE_SIZE:
+            _status_cache.popitem(last=False)
     screen.blit(status_surface, (cfg.H_PADDING, cfg.V_PADDING))
+    return status_rect
 
-    grid_top = cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT
-    for r in range(cfg.ROWS):
-        for c in range(cfg.COLUMNS):
-            rect = pygame.Rect(
-                cfg.H_PADDING + c * cfg.TILE_SIZE,
-                grid_top + r * cfg.TILE_SIZE,
-                cfg.TILE_SIZE - cfg.GRID_LINE,
-                cfg.TILE_SIZE - cfg.GRID_LINE,
-            )
-
-            if revealed[r][c]:
-                if mine_grid[r][c]:
-                    pygame.draw.rect(screen, cfg.COLOR_TILE_MINE, rect)
-                    draw_bomb_icon(screen, rect)
-                else:
-                    pygame.draw.rect(screen, cfg.COLOR_TILE_REVEALED, rect)
-                    adj = adjacency_grid[r][c]
-                    if adj > 0:
-                        color = cfg.NUMBER_COLORS.get(adj, cfg.COLOR_TEXT)
-                        text_surface = font.render(str(adj), True, color)
-                        text_rect = text_surface.get_rect(center=rect.center)
-                        screen.blit(text_surface, text_rect)
-            else:
-                pygame.draw.rect(screen, cfg.COLOR_TILE_HIDDEN, rect)
-                if flagged[r][c]:
-                    draw_watermelon_icon(screen, rect)
-
-    # Border around grid
-    grid_rect = pygame.Rect(
-        cfg.H_PADDING, grid_top, cfg.COLUMNS * cfg.TILE_SIZE, cfg.ROWS * cfg.TILE_SIZE
-    )
-    pygame.draw.rect(screen, cfg.COLOR_GRID, grid_rect, width=2)
 
-    # Footer info
+def draw_footer(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    game_state: str,
+    remaining_safe: int,
+    elapsed_seconds: int,
+) -> pygame.Rect:
+    """Draw the timer/safe-tiles footer below the grid and return the area it covers."""
+    global _footer_cache
+    width = cfg.WINDOW_WIDTH or screen.get_width()
+    height = cfg.WINDOW_HEIGHT or screen.get_height()
+    grid_bottom = cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT + cfg.ROWS * cfg.TILE_SIZE
+    footer_rect = pygame.Rect(0, grid_bottom, width, height - grid_bottom)
+    screen.fill(cfg.COLOR_BG, footer_rect)
+
     def format_time(total_seconds: int) -> str:
         minutes = total_seconds // 60
         seconds = total_seconds % 60
@@ -178,6 +312,78 @@ def draw_board(
         footer_color = cfg.COLOR_LOSE
     else:
         footer_color = cfg.COLOR_STATUS
-    footer_surface = font.render(footer_text, True, footer_color)
-    footer_y = (cfg.WINDOW_HEIGHT or screen.get_height()) - cfg.V_PADDING - cfg.FOOTER_BAR_HEIGHT + 6
+    key = (footer_text, footer_color)
+    if _footer_cache is not None and _footer_cache[0] == key:
+        footer_surface = _footer_cache[1]
+    else:
+        footer_surface = font.render(footer_text, True, footer_color).convert_alpha()
+        _footer_cache = (key, footer_surface)
+    footer_y = height - cfg.V_PADDING - cfg.FOOTER_BAR_HEIGHT + 6
     screen.blit(footer_surface, (cfg.H_PADDING, footer_y))
+    return footer_rect
+
+
+def draw_board(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    state,
+    adjacency_grid,
+    game_state: str,
+    remaining_safe: int,
+    flags_placed: int,
+    elapsed_seconds: int,
+) -> None:
+    # The bars fill their own bands and GRID_BG covers the grid, so only the
+    # side padding needs clearing
+    for rect in BG_RECTS:
+        screen.fill(cfg.COLOR_BG, rect)
+    draw_status(screen, flags_placed, game_state)
+
+    # Start from the pre-composed hidden board and overlay only the other tiles
+    screen.blit(GRID_BG, (cfg.H_PADDING, cfg.V_PADDING + cfg.STATUS_BAR_HEIGHT))
+    # Only revealed or flagged cells differ from GRID_BG
+    columns = state.shape[1]
+    size = cfg.TILE_SIZE
+    blit_seq: list[tuple[pygame.Surface, pygame.Rect]] = []
+    for i in np.flatnonzero(state & (REV | FLAG)).tolist():
+        r, c = divmod(i, columns)
+        kind = tile_kind(r, c, state, adjacency_grid)
+        blit_seq.append((TILE_CACHE[(size, kind)], TILE_RECTS[r][c]))
+    blit_tiles(screen, blit_seq)
+
+    draw_grid_border(screen)
+    draw_footer(screen, font, game_state, remaining_safe, elapsed_seconds)
+
+
+def render_dirty(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    state,
+    adjacency_grid,
+    game_state: str,
+    remaining_safe: int,
+    flags_placed: int,
+    elapsed_seconds: int,
+    dirty_cells: set[tuple[int, int]],
+    dirty_status: bool,
+) -> None:
+    """
+    Redraw only the given cells, plus the status and footer bars when
+    dirty_status is set, and push just those areas to the display.
+    """
+    rects: list[pygame.Rect] = []
+    size = cfg.TILE_SIZE
+    blit_seq: list[tuple[pygame.Surface, pygame.Rect]] = []
+    for r, c in dirty_cells:
+        rect = TILE_RECTS[r][c]
+        blit_seq.append((TILE_CACHE[(size, tile_kind(r, c, state, adjacency_grid))], rect))
+        rects.append(rect)
+    blit_tiles(screen, blit_seq)
+    if rects:
+        # Edge tiles overlap the grid border, so put it back on top
+        draw_grid_border(screen)
+    if dirty_status:
+        rects.append(draw_status(screen, flags_placed, game_state))
+        rects.append(draw_footer(screen, font, game_state, remaining_safe, elapsed_seconds))
+    if rects:
+        pygame.display.update(rects)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import sys
 import traceback
 from datetime import datetime
+from typing import TextIO
 
 import pygame
 
 from . import config as cfg
+from .fonts import clear_font_cache, get_font
+
+# run.log handle, opened on the first debug log_event and closed at exit
+_run_log: TextIO | None = None
 
 
 def log_exception_to_file(exc: BaseException) -> str:
@@ -26,11 +32,13 @@ def show_error_screen(summary: str) -> None:
     try:
         if not pygame.get_init():
             pygame.init()
+            # Fonts cached before pygame was shut down are no longer usable
+            clear_font_cache()
         width, height = 720, 220
         screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Minesweeper - Error")
-        font = pygame.font.SysFont(None, 24)
-        small = pygame.font.SysFont(None, 20)
+        font = get_font(24)
+        small = get_font(20)
 
         lines = [
             "An unexpected error occurred.",
@@ -68,12 +76,19 @@ def show_error_screen(summary: str) -> None:
         return
 
 
-def log_event(message: str) -> None:
+def log_event(message: str, *args: object) -> None:
+    # Arguments are %-formatted into the message only when debug logging is on
+    global _run_log
     if not cfg.DEBUG:
         return
     try:
+        if args:
+            message = message % args
+        if _run_log is None:
+            # Line-buffered: one write per event, no reopen per event
+            _run_log = open("run.log", "a", encoding="utf-8", buffering=1)
+            atexit.register(_run_log.close)
         timestamp = datetime.now().strftime("%H:%M:%S")
-        with open("run.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
+        _run_log.write(f"[{timestamp}] {message}\n")
     except Exception:
         pass